@@ -4,6 +4,7 @@
 Why:
 - macOS `say` voice quality varies and MP3 encoding may be unavailable on some machines.
 - Edge TTS provides much more natural Chinese voices and can directly output MP3.
+  Its MP3 bytes are kept as-is; only --boost (default mode) re-encodes them.
 
 Outputs (by default):
 - assets/audio/*.mp3      (night begin + each role begins + night_end)
@@ -13,6 +14,10 @@ Notes:
 - Generating requires internet access.
 - Playback in-app is offline; files are bundled as static assets.
 - "night.mp3" has 5s of trailing silence appended (iOS Safari workaround).
+- Each output gets a sidecar "<name>.mp3.stamp" holding a hash of its text + voice
+  settings; unchanged clips are skipped on re-runs (use --force to regenerate all).
+  Stamps are local state and git-ignored — never commit them.
+- --list-voices caches the zh-CN male voice list in .cache/edge_voices.json for 24h.
 - macOS + Homebrew Python 常遇到 SSL 证书验证失败（Netskope 等企业代理或系统证书链问题），
   加 --insecure 跳过验证即可。
 
@@ -20,6 +25,7 @@ Example:
   python3 scripts/generate_audio_edge_tts.py --voice zh-CN-YunxiNeural
   python3 scripts/generate_audio_edge_tts.py --only night_end
   python3 scripts/generate_audio_edge_tts.py --dry-run
+  python3 scripts/generate_audio_edge_tts.py --force
   python3 scripts/generate_audio_edge_tts.py --insecure --only treasure_master
 """
 
@@ -27,21 +33,36 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
+import json
+import os
+import random
 import subprocess
 import tempfile
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any, Coroutine, NamedTuple
 
+import aiohttp
 import edge_tts
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 OUT_BEGIN_DIR = ROOT_DIR / "assets" / "audio"
 OUT_END_DIR = ROOT_DIR / "assets" / "audio_end"
+VOICES_CACHE_PATH = ROOT_DIR / ".cache" / "edge_voices.json"
+VOICES_CACHE_TTL = 24 * 60 * 60  # seconds
 
 DEFAULT_VOICE = "zh-CN-YunjianNeural"
 DEFAULT_PITCH = "-20Hz"  # Lower pitch for deeper voice
 DEFAULT_RATE = "-20%"    # Slower rate for more gravitas
 DEFAULT_VOLUME = "+100%"  # Max TTS volume so role narration is clearly audible over BGM
 DEFAULT_BOOST_DB = 10      # ffmpeg post-processing gain (dB) — edge-tts caps at +100%, this adds extra loudness
+DEFAULT_GAIN_MODE = "reencode"  # App players ignore ReplayGain tags, so bake the boost in by default
+DEFAULT_CONCURRENCY = 4    # Parallel Edge TTS requests — keep small, the endpoint throttles/bans aggressive clients
+RETRY_ATTEMPTS = 5         # Per Edge TTS request, for throttling (429) and dropped connections
+RETRY_MAX_DELAY = 60       # seconds; caps both exponential backoff and Retry-After
 
 # Trailing silence duration in seconds for specific keys.
 # "night" needs 5s silence so iOS Safari doesn't break the audio chain.
@@ -134,76 +155,432 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--rate", default=DEFAULT_RATE, help=f"Rate adjustment e.g. -20%% (default: {DEFAULT_RATE})")
     parser.add_argument("--volume", default=DEFAULT_VOLUME, help=f"Volume adjustment e.g. +50%% (default: {DEFAULT_VOLUME})")
     parser.add_argument("--boost", type=int, default=DEFAULT_BOOST_DB, help=f"ffmpeg volume boost in dB (default: {DEFAULT_BOOST_DB}). 0 to disable")
+    parser.add_argument(
+        "--gain-mode",
+        choices=("reencode", "tag"),
+        default=DEFAULT_GAIN_MODE,
+        help="How to apply --boost: 'reencode' bakes it in with ffmpeg; 'tag' writes a lossless "
+        f"APEv2 REPLAYGAIN_TRACK_GAIN tag instead (needs mutagen, player must honor it) (default: {DEFAULT_GAIN_MODE})",
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help=f"Max parallel Edge TTS requests (default: {DEFAULT_CONCURRENCY})")
     parser.add_argument("--only", default="", help="Generate only one key (e.g. night_end)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the output is up to date (ignore .stamp files)")
     parser.add_argument("--dry-run", action="store_true", help="Print what would be generated")
     parser.add_argument("--list-voices", action="store_true", help="Print available zh-CN male voices")
     parser.add_argument("--insecure", action="store_true", help="Skip SSL certificate verification (for corporate proxies like Netskope)")
     return parser.parse_args()
 
 
+def read_cached_voices() -> list[dict[str, Any]] | None:
+    """Return the cached voice list if it is fresh and readable, else None."""
+    try:
+        if time.time() - VOICES_CACHE_PATH.stat().st_mtime >= VOICES_CACHE_TTL:
+            return None
+        return json.loads(VOICES_CACHE_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_cached_voices(picks: list[dict[str, Any]]) -> None:
+    VOICES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Write a sibling temp file and swap it in, so an interrupted run never
+    # leaves truncated JSON behind that still looks fresh.
+    tmp = VOICES_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(picks, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, VOICES_CACHE_PATH)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
 async def list_voices() -> None:
-    voices = await edge_tts.list_voices()
-    picks = [v for v in voices if v.get("Locale") == "zh-CN" and v.get("Gender") == "Male"]
+    # The voice catalog rarely changes: serve it from disk for VOICES_CACHE_TTL
+    # seconds instead of hitting Microsoft's endpoint on every --list-voices.
+    picks = read_cached_voices()
+    if picks is None:
+        voices = await edge_tts.list_voices()
+        # Only the filtered rows are cached, so hits skip the filter step too.
+        picks = [v for v in voices if v.get("Locale") == "zh-CN" and v.get("Gender") == "Male"]
+        write_cached_voices(picks)
+
     for v in picks:
         print(v.get("ShortName"))
 
 
-async def generate_one(key: str, text: str, voice: str, pitch: str, rate: str, volume: str, out_path: Path, dry_run: bool, boost_db: int = 0) -> None:
-    if dry_run:
-        silence = TRAILING_SILENCE.get(key, 0)
-        parts = []
-        if silence:
-            parts.append(f"+{silence}s silence")
-        if boost_db:
-            parts.append(f"+{boost_db}dB boost")
-        suffix = f" ({', '.join(parts)})" if parts else ""
-        print(f"[dry-run] -> {out_path}{suffix}")
-        return
+@dataclass(frozen=True)
+class ProsodyParams:
+    """Voice + prosody shared by every clip; validated once in `from_args`."""
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+    voice: str
+    pitch: str
+    rate: str
+    volume: str
 
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> ProsodyParams:
+        params = cls(voice=args.voice, pitch=args.pitch, rate=args.rate, volume=args.volume)
+        # Constructing a Communicate runs edge-tts's own validation without any
+        # network I/O: fail once up front instead of once per clip.
+        try:
+            params.communicate("")
+        except (TypeError, ValueError) as err:
+            raise SystemExit(f"Invalid voice/prosody settings: {err}") from None
+        return params
+
+    def communicate(self, text: str, connector: aiohttp.BaseConnector | None = None) -> edge_tts.Communicate:
+        return edge_tts.Communicate(text, self.voice, pitch=self.pitch, rate=self.rate, volume=self.volume, connector=connector)
+
+
+def stamp_path(out_path: Path) -> Path:
+    return out_path.with_suffix(out_path.suffix + ".stamp")
+
+
+def cache_key(text: str, prosody: ProsodyParams, boost_db: int, silence_seconds: int, gain_mode: str) -> str:
+    """Hash of every input that affects the generated audio."""
+    payload = json.dumps(
+        {
+            "text": text,
+            **asdict(prosody),
+            "boost_db": boost_db,
+            "gain_mode": gain_mode,
+            "silence_seconds": silence_seconds,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_up_to_date(out_path: Path, key_hash: str) -> bool:
+    stamp = stamp_path(out_path)
+    if not (out_path.exists() and stamp.exists()):
+        return False
+    return stamp.read_text(encoding="utf-8").strip() == key_hash
+
+
+class SharedTCPConnector(aiohttp.TCPConnector):
+    """TCPConnector that can be shared by many `edge_tts.Communicate` calls.
+
+    edge-tts wraps every request in its own `aiohttp.ClientSession`, which
+    closes its connector on exit. Ignore those closes so one connector (and
+    its DNS cache / connection limit) serves the whole run; `main` calls
+    `aclose()` when done.
+    """
+
+    async def close(self, *, abort_ssl: bool = False) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        await super().close()
+
+
+# Edge TTS output format. edge-tts hard-codes "audio-24khz-48kbitrate-mono-mp3"
+# and rejects any non-audio/mpeg payload, so Opus/other codecs are not an
+# option upstream. Clips that need no boost keep these bytes untouched; the
+# ffmpeg re-encode (boost only) is pinned to the same parameters so it never
+# resamples or spends extra bitrate.
+EDGE_TTS_SAMPLE_RATE = 24000
+EDGE_TTS_BITRATE = "48k"
+
+# One silent MPEG-2 Layer III frame matching the Edge TTS output format:
+# 24 kHz, mono, 48 kbps, no CRC.
+# All-zero side info means zero-length main data, so it decodes to digital
+# silence and never borrows from the bit reservoir — safe to append as-is.
+MP3_SILENT_FRAME = bytes([0xFF, 0xF3, 0x64, 0xC0]) + bytes(144 - 4)
+MP3_FRAME_SAMPLES = 576
+
+
+def mp3_frame_header(data: bytes) -> bytes | None:
+    """Return the 4-byte header of the first MPEG audio frame, skipping any ID3v2 tag."""
+    pos = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        pos = 10 + size + (10 if data[5] & 0x10 else 0)
+    header = data[pos:pos + 4]
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    return header
+
+
+def is_silence_compatible(data: bytes) -> bool:
+    """True if `data` is MPEG-2 Layer III, 24 kHz, mono, 48 kbps like MP3_SILENT_FRAME."""
+    header = mp3_frame_header(data)
+    if header is None:
+        return False
+    return (
+        header[1] & 0xFE == 0xF2  # MPEG-2, Layer III (CRC bit ignored)
+        and header[2] & 0xFC == 0x64  # 48 kbps, 24 kHz (padding/private ignored)
+        and header[3] & 0xC0 == 0xC0  # mono
+    )
+
+
+def silent_mp3(seconds: int) -> bytes:
+    frames = -(-seconds * EDGE_TTS_SAMPLE_RATE // MP3_FRAME_SAMPLES)  # ceil
+    return MP3_SILENT_FRAME * frames
+
+
+def write_replaygain_tag(path: Path, gain_db: int) -> None:
+    """Record the boost as an APEv2 ReplayGain tag instead of re-encoding the audio.
+
+    mutagen is optional; `main` checks it is installed before any work starts.
+    """
+    from mutagen.apev2 import APEv2, APENoHeaderError
+
+    try:
+        tag = APEv2(path)
+    except APENoHeaderError:
+        tag = APEv2()
+    tag["REPLAYGAIN_TRACK_GAIN"] = f"{gain_db:+.2f} dB"
+    tag.save(path)
+
+
+async def synthesize(communicate: edge_tts.Communicate) -> bytes:
+    buf = bytearray()
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            buf += chunk["data"]
+    return bytes(buf)
+
+
+def is_retryable(err: BaseException) -> bool:
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status == 429 or err.status >= 500
+    return isinstance(
+        err,
+        (
+            edge_tts.exceptions.NoAudioReceived,
+            edge_tts.exceptions.WebSocketError,
+            aiohttp.ClientConnectionError,
+            asyncio.TimeoutError,
+        ),
+    )
+
+
+def retry_delay(err: BaseException, attempt: int) -> float:
+    """Honor a numeric Retry-After header, else exponential backoff with jitter."""
+    headers = err.headers if isinstance(err, aiohttp.ClientResponseError) else None
+    if headers and headers.get("Retry-After", "").strip().isdigit():
+        return min(RETRY_MAX_DELAY, float(headers["Retry-After"]))
+    return min(RETRY_MAX_DELAY, 2 ** attempt + random.random())
+
+
+class SynthesisCache:
+    """Issues each distinct Edge TTS request once per run.
+
+    Several keys share the exact same line (seer / mirror_seer, the
+    *_reveal keys' "所有玩家请闭眼。" ...), so concurrent callers asking for the
+    same (text, voice, prosody) await one shared request and reuse its bytes.
+    Lines are never split into fragments: splicing separately synthesized
+    pieces breaks the sentence's prosody.
+    """
+
+    def __init__(self, connector: aiohttp.BaseConnector | None = None) -> None:
+        self.connector = connector
+        self.requests = 0  # Edge TTS requests actually issued
+        self.lookups = 0  # clips that asked for audio
+        self._pending: dict[tuple[str, ProsodyParams], asyncio.Future[bytes]] = {}
+
+    async def get(self, text: str, prosody: ProsodyParams) -> bytes:
+        self.lookups += 1
+        key = (text, prosody)
+        fut = self._pending.get(key)
+        if fut is None:
+            self.requests += 1
+            fut = self._pending[key] = asyncio.ensure_future(self._fetch(text, prosody))
+        return await asyncio.shield(fut)
+
+    async def _fetch(self, text: str, prosody: ProsodyParams) -> bytes:
+        for attempt in range(RETRY_ATTEMPTS):
+            # A Communicate can only be streamed once, so build a fresh one per attempt.
+            communicate = prosody.communicate(text, self.connector)
+            try:
+                return await synthesize(communicate)
+            except Exception as err:
+                if attempt == RETRY_ATTEMPTS - 1 or not is_retryable(err):
+                    raise
+                delay = retry_delay(err, attempt)
+                print(f"Retry {attempt + 1}/{RETRY_ATTEMPTS - 1} in {delay:.1f}s for {text!r}: {err!r}")
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+
+class ClipResult(NamedTuple):
+    """Outcome of one clip, collected for the summary printed by `main`."""
+
+    name: str  # e.g. "audio/night.mp3"
+    status: str  # generated | up-to-date | dry-run | failed
+    detail: str = ""
+
+
+def clip_name(out_path: Path) -> str:
+    return f"{out_path.parent.name}/{out_path.name}"
+
+
+@dataclass
+class PostProcessJob:
+    """A downloaded clip waiting for the batched ffmpeg pass."""
+
+    src: Path
+    out_path: Path
+    filters: list[str]
+    key_hash: str
+    trailing_silence: int = 0  # seconds of silent frames appended after ffmpeg
+    gain_tag_db: int = 0  # ReplayGain tag written last (--gain-mode tag)
+
+
+@dataclass(frozen=True)
+class RunContext:
+    """Per-run settings shared by every `generate_one` call."""
+
+    staging_dir: Path  # downloads awaiting the batched ffmpeg pass
+    synth: SynthesisCache
+    dry_run: bool = False
+    boost_db: int = 0
+    force: bool = False
+    gain_mode: str = DEFAULT_GAIN_MODE
+
+
+def post_filters(boost_db: int, silence_seconds: int) -> list[str]:
+    # Single filter chain: boost volume, then pad trailing silence with apad
+    # (no second anullsrc input / concat graph needed).
+    filters: list[str] = []
+    if boost_db:
+        filters.append(f"volume={boost_db}dB")
+    if silence_seconds > 0:
+        filters.append(f"apad=pad_dur={silence_seconds}")
+    return filters
+
+
+async def generate_one(key: str, text: str, prosody: ProsodyParams, out_path: Path, ctx: RunContext) -> ClipResult | PostProcessJob:
+    boost_db = ctx.boost_db
+    gain_mode = ctx.gain_mode
     silence_seconds = TRAILING_SILENCE.get(key, 0)
-    needs_ffmpeg = silence_seconds > 0 or boost_db > 0
+    # Content-addressed cache: skip the network round-trip when nothing changed.
+    key_hash = cache_key(text, prosody, boost_db, silence_seconds, gain_mode)
+    if not ctx.force and is_up_to_date(out_path, key_hash):
+        return ClipResult(clip_name(out_path), "up-to-date")
 
-    if needs_ffmpeg:
-        # Generate to temp file, then post-process with ffmpeg (boost + optional silence)
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-        try:
-            communicate = edge_tts.Communicate(text, voice, pitch=pitch, rate=rate, volume=volume)
-            await communicate.save(str(tmp_path))
-
-            cmd: list[str] = ["ffmpeg", "-y", "-i", str(tmp_path)]
-
-            if silence_seconds > 0:
-                # Add silence source input
-                cmd += ["-f", "lavfi", "-t", str(silence_seconds), "-i", "anullsrc=r=24000:cl=mono"]
-                # Build filter: boost volume then concat with silence
-                boost_filter = f"volume={boost_db}dB" if boost_db else ""
-                if boost_filter:
-                    cmd += ["-filter_complex", f"[0:a]{boost_filter}[boosted];[boosted][1:a]concat=n=2:v=0:a=1"]
-                else:
-                    cmd += ["-filter_complex", "[0:a][1:a]concat=n=2:v=0:a=1"]
-            else:
-                # Boost only, no silence
-                cmd += ["-af", f"volume={boost_db}dB"]
+    if ctx.dry_run:
+        parts = []
+        if silence_seconds:
+            parts.append(f"+{silence_seconds}s silence")
+        if boost_db:
+            parts.append(f"+{boost_db}dB {'ReplayGain tag' if gain_mode == 'tag' else 'boost'}")
+        return ClipResult(clip_name(out_path), "dry-run", ", ".join(parts))
 
-            cmd += ["-b:a", "48k", str(out_path)]
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Drop the stale stamp first so an interrupted run can never look up to date.
+    stamp_path(out_path).unlink(missing_ok=True)
+
+    audio = await ctx.synth.get(text, prosody)
+
+    # Trailing silence is appended as pre-encoded MP3 frames (bitstream concat,
+    # no decode/re-encode). Fall back to ffmpeg apad if the format ever differs.
+    bitstream_silence = silence_seconds if silence_seconds > 0 and is_silence_compatible(audio) else 0
+    # In tag mode the boost is metadata only, so ffmpeg is never needed for it.
+    gain_tag_db = boost_db if gain_mode == "tag" else 0
+    filters = post_filters(boost_db - gain_tag_db, silence_seconds - bitstream_silence)
+
+    if filters:
+        # Download only; boost is applied later by a single batched ffmpeg
+        # process (see run_post_processing).
+        src = ctx.staging_dir / f"{out_path.parent.name}__{out_path.name}"
+        src.write_bytes(audio)
+        return PostProcessJob(
+            src=src,
+            out_path=out_path,
+            filters=filters,
+            key_hash=key_hash,
+            trailing_silence=bitstream_silence,
+            gain_tag_db=gain_tag_db,
+        )
+
+    out_path.write_bytes(audio + silent_mp3(bitstream_silence))
+    parts = []
+    if bitstream_silence:
+        parts.append(f"+{bitstream_silence}s silence")
+    if gain_tag_db:
+        write_replaygain_tag(out_path, gain_tag_db)
+        parts.append(f"ReplayGain {gain_tag_db:+d}dB")
+    stamp_path(out_path).write_text(key_hash + "\n", encoding="utf-8")
+    return ClipResult(clip_name(out_path), "generated", ", ".join(parts))
+
+
+def run_ffmpeg_batch(jobs: list[PostProcessJob]) -> None:
+    """Apply every job's filter chain in ONE ffmpeg process.
+
+    Each input gets its own `[i:a]<filters>[outi]` branch in a shared
+    filter graph and is mapped to its own output file, so ffmpeg startup,
+    codec registration and graph init are paid once per batch instead of
+    per clip. Blocking — run it in an executor.
+    """
+    cmd: list[str] = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
+    for job in jobs:
+        cmd += ["-f", "mp3", "-i", str(job.src)]
+    graph = ";".join(f"[{i}:a]{','.join(job.filters)}[out{i}]" for i, job in enumerate(jobs))
+    cmd += ["-filter_complex", graph]
+    for i, job in enumerate(jobs):
+        cmd += ["-map", f"[out{i}]", "-ar", str(EDGE_TTS_SAMPLE_RATE), "-ac", "1", "-b:a", EDGE_TTS_BITRATE]
+        if job.trailing_silence:
+            # No Xing/Info frame: its frame count would hide the appended silence.
+            cmd += ["-write_xing", "0"]
+        cmd.append(str(job.out_path))
+
+    # With -loglevel error stderr stays empty unless something fails, so
+    # capturing it costs nothing on success and explains failures.
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def finish_job(job: PostProcessJob) -> ClipResult:
+    parts = list(job.filters)
+    if job.trailing_silence:
+        with job.out_path.open("ab") as f:
+            f.write(silent_mp3(job.trailing_silence))
+        parts.append(f"+{job.trailing_silence}s silence")
+    if job.gain_tag_db:
+        write_replaygain_tag(job.out_path, job.gain_tag_db)
+        parts.append(f"ReplayGain {job.gain_tag_db:+d}dB")
+    stamp_path(job.out_path).write_text(job.key_hash + "\n", encoding="utf-8")
+    return ClipResult(clip_name(job.out_path), "generated", ", ".join(parts))
+
+
+def describe_error(err: BaseException) -> str:
+    if isinstance(err, subprocess.CalledProcessError) and err.stderr:
+        lines = err.stderr.decode("utf-8", errors="replace").strip().splitlines()
+        return f"ffmpeg exit {err.returncode}: {lines[-1] if lines else ''}"
+    return repr(err)
+
+
+async def run_post_processing(jobs: list[PostProcessJob], pool: Executor, workers: int) -> list[ClipResult]:
+    """Split jobs into at most `workers` ffmpeg batches and run them in parallel."""
+    # Contiguous chunks keep the flattened results in target order for the summary.
+    size = -(-len(jobs) // workers)  # ceil
+    batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(pool, run_ffmpeg_batch, batch) for batch in batches),
+        return_exceptions=True,
+    )
+
+    clips: list[ClipResult] = []
+    for batch, result in zip(batches, results):
+        for job in batch:
+            if isinstance(result, BaseException):
+                clips.append(ClipResult(clip_name(job.out_path), "failed", describe_error(result)))
+            else:
+                clips.append(finish_job(job))
+    return clips
 
-            subprocess.run(cmd, check=True, capture_output=True)
 
-            parts = []
-            if silence_seconds:
-                parts.append(f"+{silence_seconds}s silence")
-            if boost_db:
-                parts.append(f"+{boost_db}dB")
-            print(f"Generated {out_path} ({', '.join(parts)})")
-        finally:
-            tmp_path.unlink(missing_ok=True)
-    else:
-        communicate = edge_tts.Communicate(text, voice, pitch=pitch, rate=rate, volume=volume)
-        await communicate.save(str(out_path))
-        print(f"Generated {out_path}")
+def print_summary(results: list[ClipResult]) -> None:
+    width = max(len(r.name) for r in results)
+    lines = [f"{'status':<10}  {'clip':<{width}}  detail"]
+    lines += [f"{r.status:<10}  {r.name:<{width}}  {r.detail}".rstrip() for r in results]
+    counts: dict[str, int] = {}
+    for r in results:
+        counts[r.status] = counts.get(r.status, 0) + 1
+    lines.append(", ".join(f"{n} {status}" for status, n in counts.items()))
+    print("\n".join(lines))
 
 
 async def main() -> None:
@@ -225,32 +602,87 @@ async def main() -> None:
         return
 
     only = args.only.strip()
-    pitch = args.pitch
-    rate = args.rate
-    volume = args.volume
+    prosody = ProsodyParams.from_args(args)
     boost = args.boost
 
-    if boost:
-        print(f"Post-processing: ffmpeg volume boost +{boost}dB")
-
-    tasks = []
-
-    for key, text in BEGIN_TEXT.items():
-        if only and only != key:
-            continue
-        tasks.append(generate_one(key, text, args.voice, pitch, rate, volume, OUT_BEGIN_DIR / f"{key}.mp3", args.dry_run, boost))
-
-    for key, text in END_TEXT.items():
-        if only and only != key:
-            continue
-        tasks.append(generate_one(key, text, args.voice, pitch, rate, volume, OUT_END_DIR / f"{key}.mp3", args.dry_run, boost))
+    # (key, text, output path) for every clip to generate. With --only, look the
+    # key up directly instead of scanning both tables.
+    sources = ((BEGIN_TEXT, OUT_BEGIN_DIR), (END_TEXT, OUT_END_DIR))
+    if only:
+        targets = [(only, texts[only], out_dir / f"{only}.mp3") for texts, out_dir in sources if only in texts]
+    else:
+        targets = [(key, text, out_dir / f"{key}.mp3") for texts, out_dir in sources for key, text in texts.items()]
 
-    if not tasks:
+    if not targets:
         raise SystemExit(f"No tasks to run (only={only!r}).")
 
-    # Run sequentially to avoid rate-limit spikes and to keep logs readable.
-    for t in tasks:
-        await t
+    if boost and args.gain_mode == "tag":
+        # Check the optional dependency up front: failing inside the gathered
+        # per-clip tasks would abort mid-run with half-written outputs.
+        try:
+            import mutagen.apev2  # noqa: F401
+        except ImportError:
+            raise SystemExit("--gain-mode tag requires mutagen (pip install mutagen).") from None
+        print(f"Post-processing: ReplayGain tag {boost:+d}dB (no re-encode)")
+    elif boost:
+        print(f"Post-processing: ffmpeg volume boost +{boost}dB")
+
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def generate_with_limit(coro: Coroutine[Any, Any, ClipResult | PostProcessJob]) -> ClipResult | PostProcessJob:
+        async with sem:
+            return await coro
+
+    connector = SharedTCPConnector(limit=max(1, args.concurrency), ttl_dns_cache=300)
+    synth = SynthesisCache(connector)
+    try:
+        with tempfile.TemporaryDirectory(prefix="edge_tts_") as tmp:
+            ctx = RunContext(
+                staging_dir=Path(tmp),
+                synth=synth,
+                dry_run=args.dry_run,
+                boost_db=boost,
+                force=args.force,
+                gain_mode=args.gain_mode,
+            )
+            tasks: list[tuple[Path, Coroutine[Any, Any, ClipResult | PostProcessJob]]] = [
+                (out_path, generate_one(key, text, prosody, out_path, ctx)) for key, text, out_path in targets
+            ]
+
+            # Requests are network-bound: run them concurrently, but bounded by the
+            # semaphore so we stay under Edge TTS's throttling threshold.
+            results = await asyncio.gather(*(generate_with_limit(coro) for _, coro in tasks), return_exceptions=True)
+
+            clips: list[ClipResult] = []
+            jobs: list[PostProcessJob] = []
+            for (out_path, _), r in zip(tasks, results):
+                if isinstance(r, BaseException):
+                    clips.append(ClipResult(clip_name(out_path), "failed", describe_error(r)))
+                elif isinstance(r, PostProcessJob):
+                    jobs.append(r)
+                else:
+                    clips.append(r)
+            if jobs:
+                # ffmpeg is CPU-bound: spread the batches across cores without
+                # blocking the event loop. Threads suffice — the work happens in
+                # the child processes, the threads only wait on them.
+                workers = os.cpu_count() or 1
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    clips += await run_post_processing(jobs, pool, workers)
+    finally:
+        await connector.aclose()
+
+    # One summary after everything finished, instead of interleaved per-task prints.
+    # Post-processed clips are collected last, so restore BEGIN_TEXT/END_TEXT order.
+    order = {clip_name(out_path): i for i, (_, _, out_path) in enumerate(targets)}
+    clips.sort(key=lambda c: order[c.name])
+    print_summary(clips)
+    if synth.requests:
+        shared = " (identical lines deduplicated)" if synth.requests < synth.lookups else ""
+        print(f"Edge TTS requests: {synth.requests} for {synth.lookups} clips{shared}")
+    failed = sum(1 for c in clips if c.status == "failed")
+    if failed:
+        raise SystemExit(f"{failed} of {len(clips)} clips failed.")
 
     if not args.dry_run:
         print("Done.")